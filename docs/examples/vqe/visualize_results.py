@@ -15,8 +15,9 @@ backend_names = []
 cost_function_values = []
 for task in workflow_run.get_tasks():
     if task.fn_name == "evaluate_cost_function":
-        backend_names.append(task.get_inputs().kwargs["backend_name"])
-        cost_function_values.append(task.get_outputs())
+        values = task.get_outputs()
+        backend_names += [task.get_inputs().kwargs["backend_name"]] * len(values)
+        cost_function_values += values
     if task.fn_name == "find_optimal_params":
         optimal_value = task.get_outputs()[1]
 
@@ -37,20 +37,26 @@ def find_optimal_params():
 
 
 @sdk.task
-def evaluate_cost_function(params, backend_name):
+def evaluate_cost_function(params, backend_name, n_repetitions):
     from qiskit import IBMQ
 
     IBMQ.load_account()
     runner = QiskitRunner(IBMQ.get_provider().get_backend(name=backend_name))
-    return vqe.get_cost_function(runner)(params)
+    cost_function = vqe.get_cost_function(runner)
+    return [cost_function(params) for _ in range(n_repetitions)]
 
 
 @sdk.workflow
 def vqe_workflow(backend_names, n_repetitions):
-    """Execute VQE n_repetitions times on each backend in backend_names."""
+    """Execute VQE n_repetitions times on each backend in backend_names.
+
+    All repetitions for a given backend are evaluated within a single task, so that
+    the account loading and runner setup are only done once per backend.
+    """
     params, value = find_optimal_params()
     return [
-        evaluate_cost_function(params=params, backend_name=backend_name)
+        evaluate_cost_function(
+            params=params, backend_name=backend_name, n_repetitions=n_repetitions
+        )
         for backend_name in backend_names
-        for _ in range(n_repetitions)
     ]